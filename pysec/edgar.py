@@ -1,18 +1,100 @@
+import time
+import orjson
 import requests
-import xml.etree.ElementTree as ET
 
+from collections import deque
+from collections import OrderedDict
 from typing import List
 from typing import Union
 from datetime import date
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from pysec.parser import EDGARParser
 
+# Only advertise brotli when it's installed, otherwise the response
+# can't be decoded. Gzip and deflate are always supported.
+try:
+    import brotli
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# When `requests-cache` is installed, archive requests become conditional
+# GETs against an on-disk cache, so reruns mostly see 304s with no body.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# `httpx` backs the optional HTTP/2 session, which can multiplex
+# concurrent requests over a single TLS connection.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # https://www.sec.gov/cgi-bin/srch-edgar?text=form-type%3D%2810-q*+OR+10-k*%29&first=2020&last=2020
 
+class _TTLCache():
+
+    def __init__(self, maxsize: int, ttl: int):
+        """Initalizes a small LRU cache whose entries expire after a fixed time.
+
+        Arguments:
+        ----
+        maxsize {int} -- The maximum number of entries to keep, the least
+            recently used entry is dropped once the cache is full.
+
+        ttl {int} -- How long, in seconds, an entry stays valid.
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Returns the cached value for a key, or `None` if missing or expired."""
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        timestamp, value = entry
+
+        # Expired entries are dropped, so they get refetched.
+        if time.monotonic() - timestamp > self._ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, key, value) -> None:
+        """Stores a value for a key, evicting the oldest entry if full."""
+
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
 class EDGARQuery():
 
-    def __init__(self):
-        """Initalizes the EDGAR Client with the different endpoints used."""        
+    def __init__(self, http2: bool = False):
+        """Initalizes the EDGAR Client with the different endpoints used.
+
+        Keyword Arguments:
+        ----
+        http2 {bool} -- When `True`, back the client with an HTTP/2
+            session (requires the `httpx[http2]` extra) that multiplexes
+            concurrent requests over one TLS connection, instead of the
+            default HTTP/1.1 keep-alive session. (default: {False})
+        """
 
         # base URL for the SEC EDGAR browser
         self.sec_url = "https://www.sec.gov"
@@ -23,7 +105,148 @@ class EDGARQuery():
         self.cik_lookup = 'cik_lookup'
         self.mutal_fund_search = 'series'
 
-        self.parser_client = EDGARParser()
+        # Define a retry strategy, the SEC will kick you back if you
+        # make too many requests at once.
+        self.retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+
+        # The SEC caps clients at 10 requests a second, so keep a sliding
+        # window of the last 10 request times and pause before going over.
+        self._requests_per_second = 10
+        self._request_times = deque(maxlen=self._requests_per_second)
+
+        # Reuse a single session, so the TCP + TLS connection is kept
+        # alive between requests instead of being rebuilt every call.
+        # Archive paths like the index.json files are effectively
+        # immutable once a filing posts, so when `requests-cache` is
+        # installed use a cached session that revalidates with
+        # conditional GETs instead of re-downloading the body.
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "The http2 session requires httpx, install it with `pip install httpx[http2]`."
+                )
+
+            # `requests` follows redirects by default, httpx doesn't, so
+            # turn it on to keep the two sessions interchangeable.
+            self.session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=10,
+                    max_keepalive_connections=10
+                ),
+                timeout=15,
+                follow_redirects=True
+            )
+        elif requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name='edgar',
+                backend='sqlite',
+                expire_after=86400,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+
+        # The retry adapter only applies to the `requests`-backed sessions.
+        if not http2:
+            self.session.mount(
+                self.sec_url,
+                HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=10,
+                    max_retries=self.retry_strategy
+                )
+            )
+
+        self._http2 = http2
+
+        # The SEC requires a User-Agent header on every request. The
+        # atom and JSON responses are highly compressible text, so ask
+        # for every encoding we can decode to cut the download size.
+        self.session.headers.update(
+            {
+                'User-Agent': 'python-sec (coding.sigma@gmail.com)',
+                'Accept-Encoding': _ACCEPT_ENCODING
+            }
+        )
+
+        # Workflows usually grab a company's directories and then walk the
+        # filings one at a time, so cache the directory listings. Filing
+        # directories are immutable once posted, so they keep a longer TTL
+        # than the company listing, which changes when new filings post.
+        self._directories_cache = _TTLCache(maxsize=1024, ttl=600)
+        self._directory_cache = _TTLCache(maxsize=1024, ttl=86400)
+
+        # Remember the Last-Modified header (and the result parsed from
+        # that response) per archive URL, so refetches can be conditional
+        # GETs the server answers with an empty 304 when nothing changed.
+        # Bounded like the caches above, so sweeps over thousands of CIKs
+        # don't hold every parsed listing forever.
+        self._last_modified = _TTLCache(maxsize=1024, ttl=604800)
+
+        # Hand the parser our rate-limited `_get`, so feed pagination
+        # reuses this client's session instead of opening its own.
+        self.parser_client = EDGARParser(get_request=self._get)
+
+    def __enter__(self) -> 'EDGARQuery':
+        """Allows the `EDGARQuery` object to be used as a context manager."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Closes the underlying session when the context is exited."""
+
+        self.session.close()
+
+    def _get(self, url: str, params: dict = None, **kwargs):
+        """Makes a rate-limited GET request using the shared session.
+
+        Overview:
+        ----
+        The SEC will kick back a 429 response if you make more than 10
+        requests a second, and each one of those kicks off a full retry
+        cycle with back-off. It's much cheaper to wait for a slot in the
+        current one-second window before issuing the request, so every
+        method routes its GET requests through this helper.
+
+        Arguments:
+        ----
+        url {str} -- The URL to request.
+
+        Keyword Arguments:
+        ----
+        params {dict} -- The query parameters to send. (default: {None})
+
+        Returns:
+        ----
+        The raw response object, a `requests.Response` by default or an
+            `httpx.Response` when the client was built with `http2=True`.
+        """
+
+        # `requests` quietly drops `None` query parameters, but httpx
+        # serializes them as empty strings, so strip them first.
+        if params is not None:
+            params = {
+                key: value
+                for key, value in params.items()
+                if value is not None
+            }
+
+        # If the window is full, sleep until the oldest request ages out.
+        if len(self._request_times) == self._request_times.maxlen:
+            elapsed = time.monotonic() - self._request_times[0]
+
+            if elapsed < 1.0:
+                time.sleep(1.0 - elapsed)
+
+        self._request_times.append(time.monotonic())
+
+        return self.session.get(url=url, params=params, **kwargs)
 
     def company_directories(self, cik: str) -> dict:
         """Grabs all the filing directories for a company.
@@ -64,27 +287,62 @@ class EDGARQuery():
             ]
         """
 
+        # Return the cached listing if we've seen this CIK recently.
+        cached_directories = self._directories_cache.get(cik)
+
+        if cached_directories is not None:
+            return cached_directories
+
         # Build the URL.
         url = self.sec_archive + "/{cik_number}/index.json".format(
             cik_number=cik
         )
 
-        cleaned_directories = []
-        directories = requests.get(url=url).json()
+        # If we've fetched this listing before, let the server skip the
+        # body when nothing has changed since that fetch.
+        headers = {}
+        previous = self._last_modified.get(url)
 
-        # Loop through each item.
-        for directory in directories['directory']['item']:
+        if previous is not None:
+            headers['If-Modified-Since'] = previous[0]
 
-            # Create the URL.
-            directory['url'] = self.sec_archive + "/{cik_number}/{directory_id}/index.json".format(
-                cik_number=cik,
-                directory_id=directory['name']
-            )
+        response = self._get(url=url, headers=headers)
+
+        # Nothing new has posted, so reuse the previously parsed listing.
+        if previous is not None and response.status_code == 304:
+            self._directories_cache.set(cik, previous[1])
+            return previous[1]
 
-            directory['filing_id'] = directory.pop('name')
-            directory['last_modified'] = directory.pop('last-modified')
+        # `orjson` decodes the raw bytes directly, skipping the
+        # encoding sniff and str decode the stdlib parser does.
+        directories = orjson.loads(response.content)
 
-            cleaned_directories.append(directory)
+        # The CIK is loop-invariant, so build the URL prefix and suffix
+        # once and concatenate per entry.
+        prefix = f"{self.sec_archive}/{cik}/"
+        suffix = "/index.json"
+
+        # Build each directory in a single pass, rather than mutating
+        # the parsed dictionaries key by key.
+        cleaned_directories = [
+            {
+                'filing_id': directory['name'],
+                'last_modified': directory['last-modified'],
+                'size': directory['size'],
+                'type': directory['type'],
+                'url': prefix + directory['name'] + suffix
+            }
+            for directory in directories['directory']['item']
+        ]
+
+        # Remember when the server says this listing last changed, so
+        # the next fetch can be a conditional GET.
+        last_modified = response.headers.get('Last-Modified')
+
+        if last_modified:
+            self._last_modified.set(url, (last_modified, cleaned_directories))
+
+        self._directories_cache.set(cik, cleaned_directories)
 
         return cleaned_directories
 
@@ -132,115 +390,154 @@ class EDGARQuery():
             ]
         """
 
+        # Filings are immutable once posted, so a cache hit is always valid.
+        cached_items = self._directory_cache.get((cik, filing_id))
+
+        if cached_items is not None:
+            return cached_items
+
         url = self.sec_archive + "/{cik_number}/{filing_number}/index.json".format(
             cik_number=cik,
             filing_number=filing_id
         )
 
-        cleaned_items = []
-        directory = requests.get(url=url).json()
+        # If we've fetched this filing before, let the server skip the
+        # body when nothing has changed since that fetch.
+        headers = {}
+        previous = self._last_modified.get(url)
 
-        for item in directory['directory']['item']:
+        if previous is not None:
+            headers['If-Modified-Since'] = previous[0]
 
-            item['url'] = self.sec_archive + "/{cik_number}/{directory_id}/{file_id}".format(
-                cik_number=cik,
-                directory_id=filing_id,
-                file_id=item['name']
-            )
+        response = self._get(url=url, headers=headers)
 
-            item['item_id'] = item.pop('name')
-            item['last_modified'] = item.pop('last-modified')
-            cleaned_items.append(item)
+        # The filing hasn't changed, so reuse the previously parsed items.
+        if previous is not None and response.status_code == 304:
+            self._directory_cache.set((cik, filing_id), previous[1])
+            return previous[1]
+
+        directory = orjson.loads(response.content)
+
+        # The CIK and filing ID are loop-invariant, so build the URL
+        # prefix once and concatenate per entry.
+        prefix = f"{self.sec_archive}/{cik}/{filing_id}/"
+
+        # Build each item in a single pass, rather than mutating
+        # the parsed dictionaries key by key.
+        cleaned_items = [
+            {
+                'item_id': item['name'],
+                'last_modified': item['last-modified'],
+                'size': item['size'],
+                'type': item['type'],
+                'url': prefix + item['name']
+            }
+            for item in directory['directory']['item']
+        ]
+
+        # Remember when the server says this filing last changed, so
+        # the next fetch can be a conditional GET.
+        last_modified = response.headers.get('Last-Modified')
+
+        if last_modified:
+            self._last_modified.set(url, (last_modified, cleaned_items))
+
+        self._directory_cache.set((cik, filing_id), cleaned_items)
 
         return cleaned_items
 
-    def company_filings_by_type(self, cik: str, filing_type: str) -> List[dict]:
-        """Returns all the filings of certain type for a particular company.
+    def _browse(self, num_of_items: int = None, **params) -> List[dict]:
+        """Makes a company search request against the browse service.
 
-        Arguments:
+        Overview:
         ----
-        cik {str} -- The company CIK Number.
+        Every company and filings search hits the same browse-edgar
+        endpoint and only differs in the query parameters it sets, so
+        the public search methods are all thin wrappers around this
+        one. That keeps the session, rate limiter, and retry policy
+        applied in a single place.
 
-        filing_type {str} -- The filing type ID.
+        Keyword Arguments:
+        ----
+        num_of_items {int} -- Stop grabbing next pages once this many
+            items have been passed. (default: {None})
 
+        **params -- The search-specific query parameters, merged with
+            the parameters shared by every search.
 
         Returns:
         ----
-        dict -- A Dictionary containing the filing items.
-
-        Usage:
-        ----
-            >>> edgar_client = EDGARQuery()
-            >>> company_filings = edgar_client.company_directory(cik='1265107', filing_id='000110465919038688')
-            [
-                {
-                    'item_id': '0001104659-19-038688.txt',
-                    'last_modified': '2019-07-01 17:17:26',
-                    'size': '',
-                    'type': 'text.gif',
-                    'url': 'https://www.sec.gov/Archives/edgar/data/1265107/000110465919038688/0001104659-19-038688.txt'
-                },
-                {
-                    'item_id': 'a19-12321_2425.htm',
-                    'last_modified': '2019-07-01 17:17:26',
-                    'size': '37553',
-                    'type': 'text.gif',
-                    'url': 'https://www.sec.gov/Archives/edgar/data/1265107/000110465919038688/a19-12321_2425.htm'
-                }
-            ]
+        List[dict] -- A list of Entry resources.
         """
 
-        # define the endpoint to do filing searches.
-        url = self.browse_service
-
-        # Set the params
-        params = {
+        # define the arguments shared by every search.
+        search_params = {
+            'Count': '100',
             'action': 'getcompany',
-            'CIK': cik,
-            'type': filing_type,
             'output': 'atom'
         }
+        search_params.update(params)
+
+        # The HTTP/2 client reads the body eagerly, so it falls back to
+        # the buffered content.
+        if self._http2:
+            response = self._get(url=self.browse_service, params=search_params)
 
-        # Grab the response.
-        response = requests.get(url=url, params=params)
+            entries = self.parser_client.parse_entries(
+                entries_content=response.content,
+                num_of_items=num_of_items
+            )
 
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
+            return entries
+
+        # Stream the response straight into the parser, so large feeds
+        # never have to be held in memory whole.
+        with self._get(url=self.browse_service, params=search_params, stream=True) as response:
+
+            # Have urllib3 undo the transfer encoding as the stream is read.
+            response.raw.decode_content = True
+
+            entries = self.parser_client.parse_entries_stream(
+                entries_stream=response.raw,
+                num_of_items=num_of_items
+            )
 
         return entries
 
-    def companies_by_state(self, state: str, num_of_companies: int = None) -> List[dict]:
-        """Returns all the companies that fall under a given state.
+    def company_filings_by_type(self, cik: str, filing_type: str) -> List[dict]:
+        """Returns all the filings of certain type for a particular company.
 
         Arguments:
         ----
-        state {str} -- [description]
+        cik {str} -- The company CIK Number.
+
+        filing_type {str} -- The filing type ID.
 
         Returns:
         ----
-        List[dict] -- [description]
+        List[dict] -- A list of filings.
         """
 
-        # define the arguments of the request
-        search_sic_params = {
-            'State': state,
-            'Count': '100',
-            'action': 'getcompany',
-            'output': 'atom'
-        }
+        return self._browse(CIK=cik, type=filing_type)
 
-        response = requests.get(
-            url=self.browse_service,
-            params=search_sic_params
-        )
+    def companies_by_state(self, state: str, num_of_companies: int = None) -> List[dict]:
+        """Returns all the companies that fall under a given state.
 
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(
-            entries_text=response.text,
-            num_of_items=num_of_companies
-        )
+        Arguments:
+        ----
+        state {str} -- The two character state abbreviation.
 
-        return entries
+        Keyword Arguments:
+        ----
+        num_of_companies {int} -- If you would like to limit the number of results, then
+            specify the number of companies you want back. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of Entry resources.
+        """
+
+        return self._browse(State=state, num_of_items=num_of_companies)
 
     def companies_by_country(self, country: str, num_of_companies: int = None) -> List[dict]:
         """Grabs all the companies that fall under a particular country code.
@@ -259,27 +556,7 @@ class EDGARQuery():
         List[dict] -- A list of Entry resources.
         """
 
-        # define the arguments of the request
-        search_sic_params = {
-            'Country': country,
-            'Count': '100',
-            'action': 'getcompany',
-            'output': 'atom'
-        }
-
-        # Grab the Response.
-        response = requests.get(
-            url=self.browse_service,
-            params=search_sic_params
-        )
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(
-            entries_text=response.text,
-            num_of_items=num_of_companies
-        )
-
-        return entries
+        return self._browse(Country=country, num_of_items=num_of_companies)
 
     def companies_by_sic(self, sic_code: str, num_of_companies: int = None) -> List[dict]:
         """Grabs all companies with a certain SIC code.
@@ -328,28 +605,8 @@ class EDGARQuery():
                 }
             ]
         """
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
 
-        # define the arguments of the request
-        search_sic_params = {
-            'Count': '100',
-            'SIC': sic_code,
-            'Count': '100',
-            'action': 'getcompany',
-            'output': 'atom'
-        }
-
-        # Make the response.
-        response = requests.get(
-            url=self.browse_service,
-            params=search_sic_params
-        )
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(SIC=sic_code, num_of_items=num_of_companies)
 
     def ownership_filings_by_cik(self, cik: str, before: Union[str, date] = None, after: Union[str, date] = None) -> List[dict]:
         """Returns all the ownership filings for a given CIK number in a given date range.
@@ -373,27 +630,7 @@ class EDGARQuery():
         List[dict] -- A list of ownership filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'CIK': cik,
-            'Count': '100',
-            'myowner': 'only',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(CIK=cik, myowner='only', datea=after, dateb=before)
 
     def non_ownership_filings_by_cik(self, cik: str, before: str = None, after: str = None) -> List[dict]:
         """Returns all the non-ownership filings for a given CIK number in a given date range.
@@ -414,30 +651,10 @@ class EDGARQuery():
 
         Returns:
         ----
-        List[dict] -- A list of ownership filings.
+        List[dict] -- A list of non-ownership filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'CIK': cik,
-            'Count': '100',
-            'myowner': 'exclude',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(CIK=cik, myowner='exclude', datea=after, dateb=before)
 
     def all_filings_by_cik(self, cik: str, before: str = None, after: str = None) -> List[dict]:
         """Returns all the filings (ownership and non-ownership) for a given CIK number in a given date range.
@@ -458,30 +675,10 @@ class EDGARQuery():
 
         Returns:
         ----
-        List[dict] -- A list of ownership filings.
+        List[dict] -- A list of filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'CIK': cik,
-            'Count': '100',
-            'myowner': 'include',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(CIK=cik, myowner='include', datea=after, dateb=before)
 
     def ownership_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
         """Returns all the filings ownership for a given company in a given date range.
@@ -505,27 +702,7 @@ class EDGARQuery():
         List[dict] -- A list of ownership filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'company': company_name,
-            'Count': '100',
-            'myowner': 'only',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(company=company_name, myowner='only', datea=after, dateb=before)
 
     def non_ownership_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
         """Returns all the filings non-ownership for a given company in a given date range.
@@ -546,32 +723,10 @@ class EDGARQuery():
 
         Returns:
         ----
-        List[dict] -- A list of ownership filings.
+        List[dict] -- A list of non-ownership filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'company': company_name,
-            'Count': '100',
-            'myowner': 'exclude',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        print(response.url)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(company=company_name, myowner='exclude', datea=after, dateb=before)
 
     def all_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
         """Returns all the filings (ownership and non-ownership) for a given company in a given date range.
@@ -592,27 +747,7 @@ class EDGARQuery():
 
         Returns:
         ----
-        List[dict] -- A list of ownership filings.
+        List[dict] -- A list of filings.
         """
 
-        # define the endpoint to do filing searches.
-        browse_edgar = r"https://www.sec.gov/cgi-bin/browse-edgar"
-
-        # define the arguments of the request
-        search_params = {
-            'company': company_name,
-            'Count': '100',
-            'myowner': 'include',
-            'action': 'getcompany',
-            'output': 'atom',
-            'datea': after,
-            'dateb': before
-        }
-
-        # Make the response.
-        response = requests.get(url=self.browse_service, params=search_params)
-
-        # Parse the entries.
-        entries = self.parser_client.parse_entries(entries_text=response.text)
-
-        return entries
+        return self._browse(company=company_name, myowner='include', datea=after, dateb=before)
@@ -0,0 +1,572 @@
+import asyncio
+import aiohttp
+
+from io import BytesIO
+from typing import List
+from typing import Union
+from datetime import date
+
+from aiolimiter import AsyncLimiter
+
+from pysec.parser import EDGARParser
+
+# Only advertise brotli when it's installed, otherwise the response
+# can't be decoded. Gzip and deflate are always supported.
+try:
+    import brotli
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+
+class EDGARQueryAsync():
+
+    def __init__(self):
+        """Initalizes the async EDGAR Client with the different endpoints used.
+
+        Overview:
+        ----
+        This client mirrors the `EDGARQuery` client but exposes every method
+        as a coroutine, so batches of independent requests (for example, a
+        sweep over many CIK numbers) can be fanned out with `asyncio.gather`
+        instead of being issued one at a time.
+
+        The client must be used as an async context manager, since the
+        underlying `aiohttp.ClientSession` has to be created inside a
+        running event loop.
+
+        Usage:
+        ----
+            >>> async with EDGARQueryAsync() as edgar_client:
+            ...     filings = await asyncio.gather(
+            ...         *[edgar_client.all_filings_by_cik(cik=cik) for cik in ciks]
+            ...     )
+        """
+
+        # base URL for the SEC EDGAR browser
+        self.sec_url = "https://www.sec.gov"
+        self.sec_archive = "https://www.sec.gov/Archives/edgar/data"
+        self.browse_service = "https://www.sec.gov/cgi-bin/browse-edgar"
+
+        self.parser_client = EDGARParser()
+
+        # The SEC caps clients at 10 requests a second, so the session
+        # is paired with a semaphore bounding the number of in-flight
+        # requests and a limiter bounding the rate they're issued at.
+        # All three are created in `__aenter__`, on older Pythons
+        # building them outside a running loop binds the wrong loop.
+        self._session = None
+        self._sem = None
+        self._limiter = None
+
+    async def __aenter__(self) -> 'EDGARQueryAsync':
+        """Creates the session, semaphore, and limiter inside the running loop."""
+
+        self._sem = asyncio.Semaphore(10)
+        self._limiter = AsyncLimiter(10, 1)
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            ),
+            timeout=aiohttp.ClientTimeout(total=15),
+            headers={
+                'User-Agent': 'python-sec (coding.sigma@gmail.com)',
+                'Accept-Encoding': _ACCEPT_ENCODING
+            }
+        )
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Closes the underlying session when the context is exited."""
+
+        await self._session.close()
+        self._session = None
+        self._sem = None
+        self._limiter = None
+
+    async def _get_content(self, url: str, params: dict = None) -> bytes:
+        """Makes a rate-limited GET request and returns the raw response body.
+
+        Arguments:
+        ----
+        url {str} -- The URL to request.
+
+        Keyword Arguments:
+        ----
+        params {dict} -- The query parameters to send. (default: {None})
+
+        Returns:
+        ----
+        bytes -- The raw response body.
+        """
+
+        # `requests` quietly drops `None` query parameters, but aiohttp
+        # rejects them, so strip them before building the request.
+        if params is not None:
+            params = {
+                key: value
+                for key, value in params.items()
+                if value is not None
+            }
+
+        async with self._sem, self._limiter:
+            async with self._session.get(url, params=params) as response:
+                return await response.read()
+
+    async def _get_json(self, url: str) -> dict:
+        """Makes a rate-limited GET request and returns the decoded JSON body.
+
+        Arguments:
+        ----
+        url {str} -- The URL to request.
+
+        Returns:
+        ----
+        dict -- The decoded JSON content.
+        """
+
+        async with self._sem, self._limiter:
+            async with self._session.get(url) as response:
+                return await response.json()
+
+    async def _parse_entries(self, entries_content: bytes, num_of_items: int = None) -> List[dict]:
+        """Parses an atom feed, grabbing any next pages through the session.
+
+        Overview:
+        ----
+        `EDGARParser.parse_entries` fetches next pages with blocking
+        `requests` calls, which would stall the event loop and sidestep
+        the rate limiter. The pagination loop lives here instead, so
+        every follow-up page goes through the same rate-limited session
+        as the first one.
+
+        Arguments:
+        ----
+        entries_content {bytes} -- The raw content returned from the
+            response.
+
+        Keyword Arguments:
+        ----
+        num_of_items {int} -- Stop grabbing next pages once this many
+            items have been passed. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of Entry resources.
+        """
+
+        entries, next_page = self.parser_client._parse_page(
+            source=BytesIO(entries_content)
+        )
+
+        while next_page:
+
+            current_count = int(next_page.split('&start=')[1])
+
+            if num_of_items and num_of_items < current_count:
+                break
+
+            entries_content = await self._get_content(url=next_page)
+            print('Grabbed Next URL: {url}'.format(url=next_page))
+
+            page_entries, next_page = self.parser_client._parse_page(
+                source=BytesIO(entries_content)
+            )
+            entries.extend(page_entries)
+
+        return entries
+
+    async def company_directories(self, cik: str) -> List[dict]:
+        """Grabs all the filing directories for a company.
+
+        Arguments:
+        ----
+        cik {str} -- The company CIK number, defined by the SEC.
+
+        Returns:
+        ----
+        List[dict] -- A list of the company's filing directories.
+        """
+
+        # Build the URL.
+        url = self.sec_archive + "/{cik_number}/index.json".format(
+            cik_number=cik
+        )
+
+        cleaned_directories = []
+        directories = await self._get_json(url=url)
+
+        # Loop through each item.
+        for directory in directories['directory']['item']:
+
+            # Create the URL.
+            directory['url'] = self.sec_archive + "/{cik_number}/{directory_id}/index.json".format(
+                cik_number=cik,
+                directory_id=directory['name']
+            )
+
+            directory['filing_id'] = directory.pop('name')
+            directory['last_modified'] = directory.pop('last-modified')
+
+            cleaned_directories.append(directory)
+
+        return cleaned_directories
+
+    async def company_directory(self, cik: str, filing_id: str) -> List[dict]:
+        """Grabs all the items from a specific filing.
+
+        Arguments:
+        ----
+        cik {str} -- The company CIK number, defined by the SEC.
+
+        filing_id {str} -- The ID of filing to pull.
+
+        Returns:
+        ----
+        List[dict] -- A list of the filing items.
+        """
+
+        url = self.sec_archive + "/{cik_number}/{filing_number}/index.json".format(
+            cik_number=cik,
+            filing_number=filing_id
+        )
+
+        cleaned_items = []
+        directory = await self._get_json(url=url)
+
+        for item in directory['directory']['item']:
+
+            item['url'] = self.sec_archive + "/{cik_number}/{directory_id}/{file_id}".format(
+                cik_number=cik,
+                directory_id=filing_id,
+                file_id=item['name']
+            )
+
+            item['item_id'] = item.pop('name')
+            item['last_modified'] = item.pop('last-modified')
+            cleaned_items.append(item)
+
+        return cleaned_items
+
+    async def company_filings_by_type(self, cik: str, filing_type: str) -> List[dict]:
+        """Returns all the filings of certain type for a particular company.
+
+        Arguments:
+        ----
+        cik {str} -- The company CIK Number.
+
+        filing_type {str} -- The filing type ID.
+
+        Returns:
+        ----
+        List[dict] -- A list of filings.
+        """
+
+        # Set the params
+        params = {
+            'action': 'getcompany',
+            'CIK': cik,
+            'type': filing_type,
+            'output': 'atom'
+        }
+
+        # Grab the response.
+        response_content = await self._get_content(url=self.browse_service, params=params)
+
+        # Parse the entries.
+        entries = await self._parse_entries(entries_content=response_content)
+
+        return entries
+
+    async def companies_by_state(self, state: str, num_of_companies: int = None) -> List[dict]:
+        """Returns all the companies that fall under a given state.
+
+        Arguments:
+        ----
+        state {str} -- The two character state abbreviation.
+
+        Keyword Arguments:
+        ----
+        num_of_companies {int} -- If you would like to limit the number of results, then
+            specify the number of companies you want back. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of Entry resources.
+        """
+
+        # define the arguments of the request
+        search_params = {
+            'State': state,
+            'Count': '100',
+            'action': 'getcompany',
+            'output': 'atom'
+        }
+
+        response_content = await self._get_content(
+            url=self.browse_service,
+            params=search_params
+        )
+
+        # Parse the entries.
+        entries = await self._parse_entries(
+            entries_content=response_content,
+            num_of_items=num_of_companies
+        )
+
+        return entries
+
+    async def companies_by_country(self, country: str, num_of_companies: int = None) -> List[dict]:
+        """Grabs all the companies that fall under a particular country code.
+
+        Arguments:
+        ----
+        country {str} -- The country code.
+
+        Keyword Arguments:
+        ----
+        num_of_companies {int} -- If you would like to limit the number of results, then
+            specify the number of companies you want back. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of Entry resources.
+        """
+
+        # define the arguments of the request
+        search_params = {
+            'Country': country,
+            'Count': '100',
+            'action': 'getcompany',
+            'output': 'atom'
+        }
+
+        response_content = await self._get_content(
+            url=self.browse_service,
+            params=search_params
+        )
+
+        # Parse the entries.
+        entries = await self._parse_entries(
+            entries_content=response_content,
+            num_of_items=num_of_companies
+        )
+
+        return entries
+
+    async def companies_by_sic(self, sic_code: str, num_of_companies: int = None) -> List[dict]:
+        """Grabs all companies with a certain SIC code.
+
+        Arguments:
+        ----
+        sic_code {str} -- The SIC code for a particular Industry.
+
+        Keyword Arguments:
+        ----
+        num_of_companies {int} -- If you would like to limit the number of results, then
+            specify the number of companies you want back. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of Entry resources.
+        """
+
+        # define the arguments of the request
+        search_params = {
+            'SIC': sic_code,
+            'Count': '100',
+            'action': 'getcompany',
+            'output': 'atom'
+        }
+
+        response_content = await self._get_content(
+            url=self.browse_service,
+            params=search_params
+        )
+
+        # Parse the entries.
+        entries = await self._parse_entries(
+            entries_content=response_content,
+            num_of_items=num_of_companies
+        )
+
+        return entries
+
+    async def ownership_filings_by_cik(self, cik: str, before: Union[str, date] = None, after: Union[str, date] = None) -> List[dict]:
+        """Returns all the ownership filings for a given CIK number in a given date range.
+
+        Arguments:
+        ----
+        cik {str} -- The CIK number of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. For example, "2019-12-01" means return all the filings BEFORE
+            Decemeber 1, 2019. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. For example, "2019-12-01" means return all the filings AFTER
+            Decemeber 1, 2019. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of ownership filings.
+        """
+
+        return await self._filings_query(
+            params={'CIK': cik, 'myowner': 'only', 'datea': after, 'dateb': before}
+        )
+
+    async def non_ownership_filings_by_cik(self, cik: str, before: str = None, after: str = None) -> List[dict]:
+        """Returns all the non-ownership filings for a given CIK number in a given date range.
+
+        Arguments:
+        ----
+        cik {str} -- The CIK number of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of non-ownership filings.
+        """
+
+        return await self._filings_query(
+            params={'CIK': cik, 'myowner': 'exclude', 'datea': after, 'dateb': before}
+        )
+
+    async def all_filings_by_cik(self, cik: str, before: str = None, after: str = None) -> List[dict]:
+        """Returns all the filings (ownership and non-ownership) for a given CIK number in a given date range.
+
+        Arguments:
+        ----
+        cik {str} -- The CIK number of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of filings.
+        """
+
+        return await self._filings_query(
+            params={'CIK': cik, 'myowner': 'include', 'datea': after, 'dateb': before}
+        )
+
+    async def ownership_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
+        """Returns all the filings ownership for a given company in a given date range.
+
+        Arguments:
+        ----
+        company_name {str} -- The name of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of ownership filings.
+        """
+
+        return await self._filings_query(
+            params={'company': company_name, 'myowner': 'only', 'datea': after, 'dateb': before}
+        )
+
+    async def non_ownership_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
+        """Returns all the filings non-ownership for a given company in a given date range.
+
+        Arguments:
+        ----
+        company_name {str} -- The name of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of non-ownership filings.
+        """
+
+        return await self._filings_query(
+            params={'company': company_name, 'myowner': 'exclude', 'datea': after, 'dateb': before}
+        )
+
+    async def all_filings_by_company_name(self, company_name: str, before: str = None, after: str = None) -> List[dict]:
+        """Returns all the filings (ownership and non-ownership) for a given company in a given date range.
+
+        Arguments:
+        ----
+        company_name {str} -- The name of the company to be queried.
+
+        Keyword Arguments:
+        ----
+        before {Union[str, date]} -- Represents filings that you want before a certain
+            date. (default: {None})
+
+        after {Union[str, date]} -- Represents filings that you want after a certain
+            date. (default: {None})
+
+        Returns:
+        ----
+        List[dict] -- A list of filings.
+        """
+
+        return await self._filings_query(
+            params={'company': company_name, 'myowner': 'include', 'datea': after, 'dateb': before}
+        )
+
+    async def _filings_query(self, params: dict) -> List[dict]:
+        """Makes a filings search request against the browse service.
+
+        Arguments:
+        ----
+        params {dict} -- The search-specific query parameters, merged with
+            the parameters shared by every filings search.
+
+        Returns:
+        ----
+        List[dict] -- A list of filings.
+        """
+
+        # define the arguments of the request
+        search_params = {
+            'Count': '100',
+            'action': 'getcompany',
+            'output': 'atom'
+        }
+        search_params.update(params)
+
+        # Make the response.
+        response_content = await self._get_content(url=self.browse_service, params=search_params)
+
+        # Parse the entries.
+        entries = await self._parse_entries(entries_content=response_content)
+
+        return entries
@@ -1,8 +1,11 @@
-import xml.etree.ElementTree as ET
 import requests
 
+from io import BytesIO
+from lxml import etree
+
 from typing import List
 from typing import Dict
+from typing import Tuple
 from typing import Union
 
 from requests.adapters import HTTPAdapter
@@ -10,7 +13,7 @@ from urllib3.util.retry import Retry
 
 class EDGARParser():
 
-    def __init__(self):
+    def __init__(self, get_request=None):
         """Initalizes the `EDGARParser()` Object.
 
         Parsing filings, can change depending on the filing you're working with
@@ -21,6 +24,13 @@ class EDGARParser():
         In cases, where the user needs to parse RSS feeds for the company search, then the
         parser will grab all the XML content and convert it to a Python dictionary. Additionally,
         it will grab all the next pages and parse thoses if specified.
+
+        Keyword Arguments:
+        ----
+        get_request -- A callable used to fetch next pages, typically the
+            owning client's rate-limited `_get`, so pagination reuses its
+            session, rate limiter, and headers. When not given, the parser
+            keeps a session of its own. (default: {None})
         """
 
         self.entries_namespace = {
@@ -28,6 +38,9 @@ class EDGARParser():
             'atom_with_quote':'{http://www.w3.org/2005/Atom}'
         }
 
+        self.entry_tag = self.entries_namespace['atom_with_quote'] + 'entry'
+        self.link_tag = self.entries_namespace['atom_with_quote'] + 'link'
+
         self.retry_strategy = Retry(
             total=3,
             backoff_factor=0.2,
@@ -35,54 +48,138 @@ class EDGARParser():
         )
         self.adapter = HTTPAdapter(max_retries=self.retry_strategy)
 
-    def parse_entries(self, entries_text: str, num_of_items: int = None) -> List[Dict]:
-        """Parses all the entries from an entry element list.
+        self._get_request = get_request
+        self._http = None
+
+    def parse_entries(self, entries_content: bytes, num_of_items: int = None) -> List[Dict]:
+        """Parses all the entries from an atom feed.
 
         Arguments:
         ----
-        entries_text {str} -- The raw string returned from the
+        entries_content {bytes} -- The raw content returned from the
             response.
 
+        Keyword Arguments:
+        ----
+        num_of_items {int} -- Stop grabbing next pages once this many
+            items have been passed. (default: {None})
+
         Returns:
         ----
         List[Dict] -- A dictionary containing all the information from the
             original entry element.
-        """        
+        """
 
-        # Parse the text.
-        root = ET.fromstring(entries_text)
         entries = []
         keep_going = True
 
         while keep_going:
 
-            # Check for the next page Link, if there is one.
-            next_page = self._check_for_next_page(root_document=root)
+            # Parse the current page, and check for a next page Link.
+            page_entries, next_page = self._parse_page(source=BytesIO(entries_content))
+            entries.extend(page_entries)
 
             if next_page:
                 current_count = int(next_page.split('&start=')[1])
 
-            # Find all the entries.
-            for entry in root.findall('atom:entry', namespaces=self.entries_namespace):
-                
-                # Parse the individual entry.
-                entry_dict = self.parse_entry_element(entry=entry)
-                entries.append(entry_dict)
-
             # If there is a next page continue.
             if not next_page:
                 keep_going = False
             else:
-                root = self._grab_next_page(next_url=next_page)
+                entries_content = self._grab_next_page(next_url=next_page)
                 print('Grabbed Next URL: {url}'.format(url=next_page))
-                
-                if not root or (num_of_items and num_of_items < current_count):
+
+                if not entries_content or (num_of_items and num_of_items < current_count):
                     keep_going = False
 
         return entries
-    
-    def _grab_next_page(self, next_url: str) -> ET.ElementTree:
-        """Grabs the next page text content.
+
+    def parse_entries_stream(self, entries_stream, num_of_items: int = None) -> List[Dict]:
+        """Parses all the entries from a streaming atom feed response.
+
+        Overview:
+        ----
+        Instead of materializing the whole response body first, the raw
+        response stream is fed straight into the incremental parser, so
+        the network read overlaps with the parse and peak memory stays
+        proportional to a single entry. Any follow-up pages are fetched
+        and parsed the same way `parse_entries` handles them.
+
+        Arguments:
+        ----
+        entries_stream -- A file-like object yielding the raw feed content.
+
+        Keyword Arguments:
+        ----
+        num_of_items {int} -- Stop grabbing next pages once this many
+            items have been passed. (default: {None})
+
+        Returns:
+        ----
+        List[Dict] -- A dictionary containing all the information from the
+            original entry element.
+        """
+
+        entries, next_page = self._parse_page(source=entries_stream)
+
+        while next_page:
+
+            current_count = int(next_page.split('&start=')[1])
+
+            entries_content = self._grab_next_page(next_url=next_page)
+            print('Grabbed Next URL: {url}'.format(url=next_page))
+
+            if not entries_content or (num_of_items and num_of_items < current_count):
+                break
+
+            page_entries, next_page = self._parse_page(source=BytesIO(entries_content))
+            entries.extend(page_entries)
+
+        return entries
+
+    def _parse_page(self, source) -> Tuple[List[Dict], Union[str, None]]:
+        """Incrementally parses a single page of an atom feed.
+
+        Overview:
+        ----
+        Atom feeds from EDGAR can contain hundreds of entry elements, so
+        rather than building the full document tree, `lxml.etree.iterparse`
+        (libxml2, so C speed) walks the document and each entry element is
+        cleared as soon as it has been converted. That keeps the memory
+        used proportional to a single entry, not the whole feed.
+
+        Arguments:
+        ----
+        source -- A file-like object containing the raw feed content.
+
+        Returns:
+        ----
+        Tuple[List[Dict], Union[str, None]] -- The parsed entries, and the
+            URL of the next page if there is one.
+        """
+
+        entries = []
+        next_page = None
+
+        for _, element in etree.iterparse(source, tag=(self.entry_tag, self.link_tag)):
+
+            if element.tag == self.entry_tag:
+
+                # Parse the individual entry.
+                entries.append(self.parse_entry_element(entry=element))
+
+                # Free the entry, and any fully parsed siblings before it.
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+            elif element.attrib.get('rel') == 'next':
+                next_page = element.attrib.get('href')
+
+        return entries, next_page
+
+    def _grab_next_page(self, next_url: str) -> Union[bytes, None]:
+        """Grabs the next page content.
 
         Grabbing mutliple pages can be challenging because in some
         cases the SEC will kick you back if you make too many requests
@@ -96,47 +193,60 @@ class EDGARParser():
 
         Returns:
         ----
-        ET.ElementTree -- A parsed version of the RSS Feed.
+        Union[bytes, None] -- The raw content of the next page.
         """
 
-        # Create a new session.
-        http = requests.Session()
+        # Fetch through the owning client when it handed us its `_get`,
+        # so pagination goes through the same rate limiter, pooled
+        # connection, and headers as the first page.
+        if self._get_request is not None:
+            get_request = self._get_request
+        else:
+
+            # Standalone use, keep one session with the retry strategy
+            # instead of rebuilding it per page.
+            if self._http is None:
+                self._http = requests.Session()
+                self._http.mount("https://", self.adapter)
 
-        # Set the retry strategy.
-        http.mount("https://", self.adapter)
+            get_request = self._http.get
 
         # Make the request.
         try:
-            entries_response = http.get(url=next_url)
+            entries_response = get_request(url=next_url)
         except:
             return None
 
         # If it was successful, get the data.
         if entries_response.status_code == 200:
-            root = ET.fromstring(entries_response.content)
-            return root
+            return entries_response.content
         else:
             return None
 
-    def parse_entry_element(self, entry: ET.ElementTree) -> dict:
+    def parse_entry_element(self, entry: etree._Element) -> dict:
         """Converts the XML entry element into a python dictionary.
 
         Arguments:
         ----
-        entry {ET.ElementTree} -- An entry element, that contains filing information.
+        entry {etree._Element} -- An entry element, that contains filing information.
 
         Returns:
         ----
         dict -- A dictionary version of the entry element.
-        """        
+        """
 
         entry_element_dict = {}
         replace_tag = self.entries_namespace['atom_with_quote']
 
         for entry in entry.findall("./", namespaces=self.entries_namespace):
             for element in entry.iter():
+
+                # Skip comments and processing instructions.
+                if not isinstance(element.tag, str):
+                    continue
+
                 name = element.tag.replace(replace_tag, '')
-                
+
                 if element.text :
                     entry_element_dict[name] = element.text.strip()
                 # else:
@@ -147,33 +257,3 @@ class EDGARParser():
                         entry_element_dict[name + "_{}".format(key)] = value
 
         return entry_element_dict
-
-    def _check_for_next_page(self, root_document: ET.Element) -> Union[str, None]:
-        """Checks if the RSS Feed has a next page.
-
-        Arguments:
-        ----
-        root_document {ET.Element} -- The Parsed root document, which contains entry
-            elements.
-
-        Returns:
-        ----
-        Union[str, None] -- The URL if it was found otherwise nothing.
-        """        
-
-        next_page = root_document.findall("atom:link[@rel='next']", namespaces=self.entries_namespace)
-
-        if next_page:
-            element_attributes = next_page[0].attrib
-        else:
-            return None
-
-        if 'href' in element_attributes:
-            next_page_url = element_attributes['href']
-        else:
-            return None
-
-        return next_page_url
-
-        
-
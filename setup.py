@@ -33,9 +33,31 @@ setup(
 
     # there are some dependencies to use the library, so let's list them out.
     install_requires=[
-        'requests>=2.22.0'
+        'requests>=2.22.0',
+        'orjson>=2.6.0',
+        'lxml>=4.5.0'
     ],
 
+    # the async client is optional, so only pull in aiohttp if someone asks for it.
+    extras_require={
+        'async': [
+            'aiohttp>=3.6.0',
+            'aiolimiter>=1.0.0'
+        ],
+        # brotli-compressed responses are smaller than gzip, but the decoder is optional.
+        'brotli': [
+            'brotli>=1.0.0'
+        ],
+        # an on-disk HTTP cache, so reruns revalidate instead of re-downloading.
+        'cache': [
+            'requests-cache>=0.7.0'
+        ],
+        # HTTP/2 multiplexing for concurrent requests on one connection.
+        'http2': [
+            'httpx[http2]>=0.20.0'
+        ]
+    },
+
     # some keywords for my library.
     keywords='finance, sec, api, web scraping, financial disclosures',
 
@@ -0,0 +1,117 @@
+"""Unit test module for the async EDGAR Session.
+
+Will perform a smoke test of each coroutine, making sure the
+calls complete against the live API.
+"""
+
+import asyncio
+import unittest
+from unittest import TestCase
+from pysec.edgar_async import EDGARQueryAsync
+
+
+class PyRobotAsyncSession(TestCase):
+
+    """Will perform a unit test for the async EDGAR session."""
+
+    maxDiff = None
+
+    def setUp(self) -> None:
+        """Set up the Robot."""
+
+        # This is Facebook.
+        self.cik_number = '1265107'
+
+    def test_creates_instance_of_session(self):
+        """Create an instance and make sure it's an async client."""
+
+        self.assertIsInstance(EDGARQueryAsync(), EDGARQueryAsync)
+
+    def test_grab_company_directories(self):
+        """Test pulling the directories for a particular CIK number."""
+
+        async def grab_directories():
+            async with EDGARQueryAsync() as edgar_client:
+                return await edgar_client.company_directories(cik=self.cik_number)
+
+        company_directories = asyncio.run(grab_directories())
+
+        self.assertIsInstance(company_directories, list)
+        self.assertIn('filing_id', company_directories[0])
+
+    def test_grab_company_directory(self):
+        """Test grabbing a single filing for a particular CIK number."""
+
+        async def grab_directory():
+            async with EDGARQueryAsync() as edgar_client:
+                return await edgar_client.company_directory(
+                    cik=self.cik_number,
+                    filing_id="000110465919038688"
+                )
+
+        company_directory = asyncio.run(grab_directory())
+
+        self.assertIsInstance(company_directory, list)
+        self.assertIn('item_id', company_directory[0])
+
+    def test_grab_filing_by_type(self):
+        """Test grabbing a specific filing type for a particular company."""
+
+        async def grab_filings():
+            async with EDGARQueryAsync() as edgar_client:
+                return await edgar_client.company_filings_by_type(
+                    cik=self.cik_number,
+                    filing_type='10-K'
+                )
+
+        facebook_10ks = asyncio.run(grab_filings())
+
+        self.assertIsInstance(facebook_10ks, list)
+        self.assertEqual(facebook_10ks[0]['filing-type'], '10-K')
+
+    def test_grab_cik_filings_without_dates(self):
+        """Test the CIK filings coroutines with `before` and `after` left unset."""
+
+        async def grab_filings():
+            async with EDGARQueryAsync() as edgar_client:
+                return await asyncio.gather(
+                    edgar_client.ownership_filings_by_cik(cik='1326801'),
+                    edgar_client.non_ownership_filings_by_cik(cik='1326801'),
+                    edgar_client.all_filings_by_cik(cik='1326801')
+                )
+
+        for filings in asyncio.run(grab_filings()):
+            self.assertIsInstance(filings, list)
+
+    def test_grab_company_name_filings_without_dates(self):
+        """Test the company name filings coroutines with `before` and `after` left unset."""
+
+        async def grab_filings():
+            async with EDGARQueryAsync() as edgar_client:
+                return await asyncio.gather(
+                    edgar_client.ownership_filings_by_company_name(company_name='Facebook'),
+                    edgar_client.non_ownership_filings_by_company_name(company_name='Facebook'),
+                    edgar_client.all_filings_by_company_name(company_name='Facebook')
+                )
+
+        for filings in asyncio.run(grab_filings()):
+            self.assertIsInstance(filings, list)
+
+    def test_grab_companies_by_sic(self):
+        """Test grabbing the companies that fall under a SIC code."""
+
+        async def grab_companies():
+            async with EDGARQueryAsync() as edgar_client:
+                return await edgar_client.companies_by_sic(
+                    sic_code="3841",
+                    num_of_companies=300
+                )
+
+        sic_content = asyncio.run(grab_companies())
+
+        self.assertIsInstance(sic_content, list)
+        self.assertIn('cik', sic_content[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()